@@ -119,11 +119,14 @@ done
 mkdir -p "$RESULTS_DIR"
 schedule_timestamp="$(date +"%Y%m%d_%H%M%S")"
 schedule_file="$RESULTS_DIR/schedule_${schedule_timestamp}.csv"
-printf "run_index,tool,mode\n" > "$schedule_file"
-for ((i=0; i<${#schedule[@]}; i++)); do
-  IFS=":" read -r tool mode <<< "${schedule[$i]}"
-  printf "%d,%s,%s\n" "$((i+1))" "$tool" "$mode" >> "$schedule_file"
-done
+# Write the schedule in one redirect.
+{
+  printf "run_index,tool,mode\n"
+  for ((i=0; i<${#schedule[@]}; i++)); do
+    IFS=":" read -r tool mode <<< "${schedule[$i]}"
+    printf "%d,%s,%s\n" "$((i+1))" "$tool" "$mode"
+  done
+} > "$schedule_file"
 
 echo ""
 echo "========================================"
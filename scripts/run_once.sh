@@ -145,6 +145,17 @@ venv_pip() {
   fi
 }
 
+# -------- Timing --------
+# Real-time (wall) clock in integer microseconds. EPOCHREALTIME needs bash >= 5;
+# older shells (e.g. macOS /bin/bash) fall back to `date +%s` with whole-second resolution.
+now_us() {
+  if [[ -n "${EPOCHREALTIME:-}" ]]; then
+    NOW_US="${EPOCHREALTIME/[.,]/}"
+  else
+    NOW_US=$(( $(date +%s) * 1000000 ))
+  fi
+}
+
 # -------- Prep output --------
 mkdir -p "$ROOT_DIR/$RESULTS_DIR"
 
@@ -252,7 +263,8 @@ fi
 
 echo "Running: $CMD"
 
-run_start_s="$(date +%s)"
+now_us
+run_start_us="$NOW_US"
 
 # Use an explicit shell path on Windows so EnergiBridge does not resolve to
 # the WSL launcher (C:\Windows\System32\bash.exe).
@@ -275,11 +287,16 @@ set +e
 command_exit=$?
 set -e
 
-run_end_s="$(date +%s)"
-wall_clock_s=$((run_end_s - run_start_s))
+now_us
+wall_clock_us=$((NOW_US - run_start_us))
+# A wall clock can step backwards mid-run; never record a negative duration.
+if [[ "$wall_clock_us" -lt 0 ]]; then
+  wall_clock_us=0
+fi
+printf -v wall_clock_s "%d.%06d" $((wall_clock_us / 1000000)) $((wall_clock_us % 1000000))
 
-printf "tool,mode,os,arch,timestamp,interval_arg,wall_clock_s,exit_code,csv_file,cmdlog_file\n" > "$metafile"
-printf "%s,%s,%s,%s,%s,%s,%s,%s,%s,%s\n" \
+# Write the metadata sidecar.
+printf "tool,mode,os,arch,timestamp,interval_arg,wall_clock_s,exit_code,csv_file,cmdlog_file\n%s,%s,%s,%s,%s,%s,%s,%s,%s,%s\n" \
   "$TOOL" \
   "$MODE" \
   "$OS" \
@@ -288,8 +305,8 @@ printf "%s,%s,%s,%s,%s,%s,%s,%s,%s,%s\n" \
   "$INTERVAL" \
   "$wall_clock_s" \
   "$command_exit" \
-  "$(basename "$outfile")" \
-  "$(basename "$cmdlog")" >> "$metafile"
+  "${outfile##*/}" \
+  "${cmdlog##*/}" > "$metafile"
 
 if [[ "$command_exit" -ne 0 ]]; then
   echo "ERROR: benchmark command failed with exit code $command_exit"